@@ -9,10 +9,18 @@ import maya.cmds
 import cgp_maya_utils.constants
 
 
+_DEFAULT_TANGENT_TYPE = cgp_maya_utils.constants.TangentType.AUTO
+_VALID_TANGENT_TYPES = cgp_maya_utils.constants.TangentType.ALL_SET
+
+
 class AnimKey(object):
     """animation key object that manipulates a key of an animCurve stored in an animCurve node
     """
 
+    # ATTRIBUTES #
+
+    __slots__ = ('_node', '_frame', '_value', '_timeRange', '_tangentTypes')
+
     # INIT #
 
     def __init__(self, node, frame, value):
@@ -32,6 +40,8 @@ class AnimKey(object):
         self._node = str(node)
         self._frame = frame
         self._value = value
+        self._timeRange = (frame, frame)
+        self._tangentTypes = None
 
     def __repr__(self):
         """the representation of the animation key
@@ -71,30 +81,43 @@ class AnimKey(object):
         """
 
         # init
-        frame = frame or maya.cmds.currentTime(query=True)
-        inTangentType = inTangentType or cgp_maya_utils.constants.TangentType.AUTO
-        outTangentType = outTangentType or cgp_maya_utils.constants.TangentType.AUTO
+        node = str(node)
+        frame = maya.cmds.currentTime(query=True) if frame is None else frame
 
-        # errors
-        for tangentType in [inTangentType, outTangentType]:
-            if tangentType not in cgp_maya_utils.constants.TangentType.ALL:
-                raise ValueError('{0} is not a valid tangent type - {1}'
-                                 .format(tangentType, cgp_maya_utils.constants.TangentType.ALL))
+        # get animKey object
+        animKey = cls(node, frame, value)
 
-        # set key
+        # insert key - tangent types are driven by the curve
         if value is None:
-            maya.cmds.setKeyframe(str(node),
+            maya.cmds.setKeyframe(node,
                                   time=frame,
                                   i=True)
+
+        # set key
         else:
-            maya.cmds.setKeyframe(str(node),
+
+            # init
+            inTangentType = _DEFAULT_TANGENT_TYPE if inTangentType is None else inTangentType
+            outTangentType = _DEFAULT_TANGENT_TYPE if outTangentType is None else outTangentType
+
+            # errors
+            for tangentType in [inTangentType, outTangentType]:
+                if tangentType not in _VALID_TANGENT_TYPES:
+                    raise ValueError('{0} is not a valid tangent type - {1}'
+                                     .format(tangentType, cgp_maya_utils.constants.TangentType.ALL))
+
+            # execute
+            maya.cmds.setKeyframe(node,
                                   time=frame,
                                   value=value,
                                   itt=inTangentType,
                                   ott=outTangentType)
 
+            # tangent types are known - no need to query them back
+            animKey._tangentTypes = (inTangentType, outTangentType)
+
         # return
-        return cls(node, frame, value)
+        return animKey
 
     # COMMANDS #
 
@@ -120,10 +143,7 @@ class AnimKey(object):
         """
 
         # return
-        return maya.cmds.keyTangent(self._node,
-                                    query=True,
-                                    inTangentType=True,
-                                    time=(self.frame(), self.frame()))[0]
+        return self._queryTangentTypes()[0]
 
     def frame(self):
         """the frame of the animation key
@@ -143,10 +163,7 @@ class AnimKey(object):
         """
 
         # return
-        return maya.cmds.keyTangent(self._node,
-                                    query=True,
-                                    outTangentType=True,
-                                    time=(self.frame(), self.frame()))[0]
+        return self._queryTangentTypes()[1]
 
     def value(self):
         """the value of the animation key
@@ -157,3 +174,25 @@ class AnimKey(object):
 
         # return
         return self._value
+
+    # PRIVATE COMMANDS #
+
+    def _queryTangentTypes(self):
+        """the inTangent and outTangent types of the animation key - queried once then stored on the animation key
+
+        :return: the inTangent type and the outTangent type of the animation key
+        :rtype: tuple[str]
+        """
+
+        # query both tangent types in a single call
+        if self._tangentTypes is None:
+            tangentTypes = maya.cmds.keyTangent(self._node,
+                                                query=True,
+                                                inTangentType=True,
+                                                outTangentType=True,
+                                                time=self._timeRange)
+
+            self._tangentTypes = (tangentTypes[0], tangentTypes[1])
+
+        # return
+        return self._tangentTypes
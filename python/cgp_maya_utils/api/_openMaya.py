@@ -13,10 +13,25 @@ import maya.cmds
 import cgp_maya_utils.constants
 
 
+_DEG_TO_RAD = math.pi / 180.0
+_RAD_TO_DEG = 180.0 / math.pi
+
+_ROTATE_ORDERS = cgp_maya_utils.constants.RotateOrder.ALL
+_VALID_ROTATE_ORDERS = cgp_maya_utils.constants.RotateOrder.ALL_SET
+_ROTATE_ORDER_TO_K = {rotateOrder: getattr(maya.api.OpenMaya.MTransformationMatrix, 'k{0}'.format(rotateOrder.upper()))
+                      for rotateOrder in _VALID_ROTATE_ORDERS}
+_ROTATE_ORDER_TO_EULER_K = {rotateOrder: getattr(maya.api.OpenMaya.MEulerRotation, 'k{0}'.format(rotateOrder.upper()))
+                            for rotateOrder in _VALID_ROTATE_ORDERS}
+
+
 class MayaObject(maya.api.OpenMaya.MObject):
     """MObject with custom functionalities
     """
 
+    # ATTRIBUTES #
+
+    __slots__ = ('_node',)
+
     # INIT #
 
     def __init__(self, node):
@@ -54,6 +69,10 @@ class TransformationMatrix(maya.api.OpenMaya.MTransformationMatrix):
     """MTransformationMatrix with custom functionalities
     """
 
+    # ATTRIBUTES #
+
+    __slots__ = ()
+
     # INIT #
 
     def __init__(self, matrix=None, translate=None, rotate=None, scale=None, shear=None, rotateOrder=None):
@@ -74,15 +93,18 @@ class TransformationMatrix(maya.api.OpenMaya.MTransformationMatrix):
         :param shear: value of shear of the transformationMatrix - ONLY IF MATRIX NOT SPECIFIED
         :type shear: list[int, float]
 
-        :param rotateOrder: value of rotateOrder of the transformationMatrix
+        :param rotateOrder: value of rotateOrder of the transformationMatrix - default is ``RotateOrder.XYZ``
         :type rotateOrder: :str
 
         :return: the transformation matrix
         :rtype: :class:`cgp_maya_utils.api.TransformationMatrix`
         """
 
+        # init
+        rotateOrder = cgp_maya_utils.constants.RotateOrder.XYZ if rotateOrder is None else rotateOrder
+
         # matrix list mode
-        if matrix:
+        if matrix is not None:
 
             # init MMatrix if necessary
             if isinstance(matrix, list):
@@ -99,11 +121,12 @@ class TransformationMatrix(maya.api.OpenMaya.MTransformationMatrix):
 
             # init
             super(TransformationMatrix, self).__init__()
-            translate = translate or [0, 0, 0]
-            rotate = [math.radians(angle) for angle in rotate] if rotate else [0, 0, 0]
-            scale = scale or [1, 1, 1]
-            shear = shear or [0, 0, 0]
-            rotateOrder = rotateOrder or cgp_maya_utils.constants.RotateOrder.XYZ
+            translate = [0, 0, 0] if translate is None else translate
+            rotate = [0, 0, 0] if rotate is None else [rotate[0] * _DEG_TO_RAD,
+                                                       rotate[1] * _DEG_TO_RAD,
+                                                       rotate[2] * _DEG_TO_RAD]
+            scale = [1, 1, 1] if scale is None else scale
+            shear = [0, 0, 0] if shear is None else shear
 
             # set rotateOrder
             self.setRotateOrder(rotateOrder)
@@ -112,10 +135,10 @@ class TransformationMatrix(maya.api.OpenMaya.MTransformationMatrix):
             self.setTranslation(maya.api.OpenMaya.MVector(*translate), maya.api.OpenMaya.MSpace.kWorld)
 
             # set rotations
-            eulerRotation = maya.api.OpenMaya.MEulerRotation()
-            eulerRotateOrder = getattr(eulerRotation, 'k{0}'.format(rotateOrder.upper()))
-            eulerRotation.setValue(maya.api.OpenMaya.MVector(*rotate), eulerRotateOrder)
-            self.setRotation(eulerRotation)
+            self.setRotation(maya.api.OpenMaya.MEulerRotation(rotate[0],
+                                                              rotate[1],
+                                                              rotate[2],
+                                                              _ROTATE_ORDER_TO_EULER_K[rotateOrder]))
 
             # set scale
             self.setScale(scale, maya.api.OpenMaya.MSpace.kWorld)
@@ -152,7 +175,7 @@ class TransformationMatrix(maya.api.OpenMaya.MTransformationMatrix):
         result = self.asMatrix() * matrix
 
         # return
-        return TransformationMatrix.fromMatrix(result, rotateOrder=self.rotateOrder())
+        return TransformationMatrix._fromMMatrix(result, self.rotationOrder())
 
     # OBJECT COMMANDS #
 
@@ -172,7 +195,9 @@ class TransformationMatrix(maya.api.OpenMaya.MTransformationMatrix):
 
         # init
         attribute = str(attribute)
-        rotateOrder = rotateOrder or maya.cmds.getAttr('{0}.rotateOrder'.format(attribute.split('.')[0]), asString=True)
+        rotateOrder = (maya.cmds.getAttr('{0}.rotateOrder'.format(attribute.partition('.')[0]), asString=True)
+                       if rotateOrder is None
+                       else rotateOrder)
 
         # execute
         matrix = maya.cmds.getAttr(attribute)
@@ -180,6 +205,51 @@ class TransformationMatrix(maya.api.OpenMaya.MTransformationMatrix):
         # return
         return cls(matrix=matrix, rotateOrder=rotateOrder)
 
+    @classmethod
+    def fromAttributes(cls, attributes, rotateOrder=None):
+        """get the transformationMatrices from the specified attributes - each plug is read through the api
+
+        :param attributes: attributes to get the matrices from - ``[transform1.matrix, transform2.worldMatrix ...]``
+        :type attributes: list[str] or list[:class:`cgp_maya_utils.scene.Attribute`]
+
+        :param rotateOrder: rotateOrder of the transformationMatrices to get - use transform ones if nothing specified
+        :type rotateOrder: str
+
+        :return: the transformationMatrices
+        :rtype: list[:class:`cgp_maya_utils.api.TransformationMatrix`]
+        """
+
+        # init
+        transformationMatrices = []
+
+        # execute
+        for attribute in attributes:
+
+            # get selection list - one per attribute as a shared one merges duplicates and expands wildcards so
+            # its plugs would not line up with the attributes
+            selectionList = maya.api.OpenMaya.MSelectionList()
+            selectionList.add(str(attribute))
+
+            # get plug - array attributes like worldMatrix are read at their first element as getAttr does
+            plug = selectionList.getPlug(0)
+            plug = plug.elementByLogicalIndex(0) if plug.isArray else plug
+
+            # get rotateOrder
+            if rotateOrder is None:
+                rotateOrderPlug = maya.api.OpenMaya.MFnDependencyNode(plug.node()).findPlug('rotateOrder', False)
+                matrixRotateOrder = _ROTATE_ORDERS[rotateOrderPlug.asInt()]
+            else:
+                matrixRotateOrder = rotateOrder
+
+            # get matrix
+            matrix = maya.api.OpenMaya.MFnMatrixData(plug.asMObject()).matrix()
+
+            # update
+            transformationMatrices.append(cls(matrix=matrix, rotateOrder=matrixRotateOrder))
+
+        # return
+        return transformationMatrices
+
     @classmethod
     def fromMatrix(cls, matrix, rotateOrder=None):
         """get the transformationMatrix from the specified matrix
@@ -195,7 +265,7 @@ class TransformationMatrix(maya.api.OpenMaya.MTransformationMatrix):
         """
 
         # init
-        rotateOrder = rotateOrder or cgp_maya_utils.constants.RotateOrder.XYZ
+        rotateOrder = cgp_maya_utils.constants.RotateOrder.XYZ if rotateOrder is None else rotateOrder
 
         # return
         return cls(matrix=matrix, rotateOrder=rotateOrder)
@@ -236,7 +306,7 @@ class TransformationMatrix(maya.api.OpenMaya.MTransformationMatrix):
         """
 
         # return
-        return cgp_maya_utils.constants.RotateOrder.ALL[self.rotationOrder() - 1]
+        return _ROTATE_ORDERS[self.rotationOrder() - 1]
 
     def setRotateOrder(self, rotateOrder):
         """set the rotateOrder of the transformationMatrix
@@ -246,13 +316,11 @@ class TransformationMatrix(maya.api.OpenMaya.MTransformationMatrix):
         """
 
         # errors
-        if rotateOrder not in cgp_maya_utils.constants.RotateOrder.ALL:
-            raise ValueError('{0} is not a valid rotateOrder - {1}'
-                             .format(rotateOrder, cgp_maya_utils.constants.RotateOrder.ALL))
+        if rotateOrder not in _VALID_ROTATE_ORDERS:
+            raise ValueError('{0} is not a valid rotateOrder - {1}'.format(rotateOrder, _ROTATE_ORDERS))
 
         # execute
-        mRotateOrder = getattr(self, 'k{0}'.format(rotateOrder.upper()))
-        self.reorderRotation(mRotateOrder)
+        self.reorderRotation(_ROTATE_ORDER_TO_K[rotateOrder])
 
     def transformValues(self):
         """the transform values stored in the transformation matrix
@@ -270,6 +338,32 @@ class TransformationMatrix(maya.api.OpenMaya.MTransformationMatrix):
         # return
         return {'rotateOrder': self.rotateOrder(),
                 'translate': [translate.x, translate.y, translate.z],
-                'rotate': [math.degrees(angle) for angle in rotate],
+                'rotate': [rotate.x * _RAD_TO_DEG, rotate.y * _RAD_TO_DEG, rotate.z * _RAD_TO_DEG],
                 'scale': scale,
                 'shear': shear}
+
+    # PRIVATE COMMANDS #
+
+    @classmethod
+    def _fromMMatrix(cls, mMatrix, mRotateOrder):
+        """get the transformationMatrix from an MMatrix without going through the initialization checks
+
+        :param mMatrix: MMatrix used to initialize the transformationMatrix
+        :type mMatrix: :class:`maya.api.OpenMaya.MMatrix`
+
+        :param mRotateOrder: rotation order of the transformationMatrix - ``MTransformationMatrix.kXYZ`` ...
+        :type mRotateOrder: int
+
+        :return: the transformationMatrix
+        :rtype: :class:`cgp_maya_utils.api.TransformationMatrix`
+        """
+
+        # init
+        transformationMatrix = cls.__new__(cls)
+        maya.api.OpenMaya.MTransformationMatrix.__init__(transformationMatrix, mMatrix)
+
+        # set rotateOrder
+        transformationMatrix.reorderRotation(mRotateOrder)
+
+        # return
+        return transformationMatrix
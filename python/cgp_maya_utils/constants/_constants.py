@@ -3,6 +3,7 @@ constants used to manipulate maya data
 """
 
 # imports python
+import collections
 import os
 
 # imports third-parties
@@ -48,10 +49,11 @@ class AttributeType(object):
     TDATACOMPOUND = 'TdataCompound'
     TIME = 'time'
     VECTOR_ARRAY = 'vectorArray'
-    ALL = [BOOLEAN, BYTE, CHAR, COMPOUND, DOUBLE, DOUBLE2, DOUBLE3, DOUBLE_ANGLE, DOUBLE_ARRAY, DOUBLE_LINEAR, ENUM,
-           FLOAT, FLOAT2, FLOAT3, FLOAT_ARRAY, FLOAT_MATRIX, INT_32_ARRAY, LATTICE, LONG, LONG2, LONG3, MATRIX, MESH,
-           MESSAGE, NURBSCURVE, NURBSSURFACE, POINT_ARRAY, REFLECTANCE_RGB, SHORT, SHORT2, SHORT3, SPECTRUM,
-           SPECTRUM_RGB, STRING, STRING_ARRAY, TDATACOMPOUND, TIME, VECTOR_ARRAY]
+    ALL = (BOOLEAN, BYTE, CHAR, COMPOUND, DOUBLE, DOUBLE2, DOUBLE3, DOUBLE_ANGLE, DOUBLE_ARRAY, DOUBLE_LINEAR,
+           ENUM, FLOAT, FLOAT2, FLOAT3, FLOAT_ARRAY, FLOAT_MATRIX, INT_32_ARRAY, LATTICE, LONG, LONG2, LONG3,
+           MATRIX, MESH, MESSAGE, NURBSCURVE, NURBSSURFACE, POINT_ARRAY, REFLECTANCE_RGB, SHORT, SHORT2,
+           SHORT3, SPECTRUM, SPECTRUM_RGB, STRING, STRING_ARRAY, TDATACOMPOUND, TIME, VECTOR_ARRAY)
+    ALL_SET = frozenset(ALL)
 
 
 class ComponentType(object):
@@ -68,16 +70,20 @@ class ComponentType(object):
     SURFACE_PATCH = 'sf'
     SURFACE_POINT = 'cv'
 
-    MESH = [EDGE, FACE, VERTEX]
-    NURBS_CURVE = [CURVE_POINT, EDIT_POINT]
-    NURBS_SURFACE = [ISOPARM_U, ISOPARM_V, SURFACE_PATCH, SURFACE_POINT]
-    ALL = MESH + NURBS_CURVE + NURBS_SURFACE
+    MESH = (EDGE, FACE, VERTEX)
+    MESH_SET = frozenset(MESH)
+    NURBS_CURVE = (CURVE_POINT, EDIT_POINT)
+    NURBS_CURVE_SET = frozenset(NURBS_CURVE)
+    NURBS_SURFACE = (ISOPARM_U, ISOPARM_V, SURFACE_PATCH, SURFACE_POINT)
+    NURBS_SURFACE_SET = frozenset(NURBS_SURFACE)
+    ALL = tuple(collections.OrderedDict.fromkeys(MESH + NURBS_CURVE + NURBS_SURFACE))
+    ALL_SET = frozenset(ALL)
 
 
 class Environment(cgp_generic_utils.constants.Environment):
 
     # maya utils root
-    MAYA_UTILS_ROOT = os.sep.join(os.path.dirname(__file__).split(os.sep)[:-3])
+    MAYA_UTILS_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
     # shape libraries
     NURBS_CURVE_LIBRARY = os.path.join(MAYA_UTILS_ROOT, 'shapes', 'nurbsCurve')
@@ -92,12 +98,14 @@ class GeometryData(object):
     CUBIC = 3
     DEGREE_5 = 5
     DEGREE_7 = 7
-    DEGREES = [LINEAR, DEGREE_2, CUBIC, DEGREE_5, DEGREE_7]
+    DEGREES = (LINEAR, DEGREE_2, CUBIC, DEGREE_5, DEGREE_7)
+    DEGREES_SET = frozenset(DEGREES)
 
     OPEN = 'Open'
     CLOSED = 'Closed'
     PERIODIC = 'Periodic'
-    FORMS = [OPEN, CLOSED, PERIODIC]
+    FORMS = (OPEN, CLOSED, PERIODIC)
+    FORMS_SET = frozenset(FORMS)
 
 
 class InfluenceAssociation(object):
@@ -106,38 +114,45 @@ class InfluenceAssociation(object):
     LABEL = 'label'
     NAME = 'name'
     ONE_TO_ONE = 'oneToOne'
-    ALL = [CLOSEST_BONE, CLOSEST_JOINT, LABEL, NAME, ONE_TO_ONE]
+    ALL = (CLOSEST_BONE, CLOSEST_JOINT, LABEL, NAME, ONE_TO_ONE)
+    ALL_SET = frozenset(ALL)
 
 
 class Solver(object):
     IK_SC_SOLVER = 'ikSCsolver'
     IK_RP_SOLVER = 'ikRPsolver'
     IK_SPLINE_SOLVER = 'splineSolver'
-    IK_SOLVERS = [IK_SC_SOLVER, IK_RP_SOLVER, IK_SPLINE_SOLVER]
+    IK_SOLVERS = (IK_SC_SOLVER, IK_RP_SOLVER, IK_SPLINE_SOLVER)
+    IK_SOLVERS_SET = frozenset(IK_SOLVERS)
 
 
 class NodeType(object):
     ANIM_CURVE_TA = 'animCurveTA'
     ANIM_CURVE_TL = 'animCurveTL'
     ANIM_CURVE_TU = 'animCurveTU'
-    ANIM_CURVES = [ANIM_CURVE_TA, ANIM_CURVE_TL, ANIM_CURVE_TU]
+    ANIM_CURVES = (ANIM_CURVE_TA, ANIM_CURVE_TL, ANIM_CURVE_TU)
+    ANIM_CURVES_SET = frozenset(ANIM_CURVES)
     AIM_CONSTRAINT = 'aimConstraint'
     ORIENT_CONSTRAINT = 'orientConstraint'
     PARENT_CONSTRAINT = 'parentConstraint'
     POINT_CONSTRAINT = 'pointConstraint'
     SCALE_CONSTRAINT = 'scaleConstraint'
-    CONSTRAINTS = [AIM_CONSTRAINT, ORIENT_CONSTRAINT, PARENT_CONSTRAINT, POINT_CONSTRAINT, SCALE_CONSTRAINT]
+    CONSTRAINTS = (AIM_CONSTRAINT, ORIENT_CONSTRAINT, PARENT_CONSTRAINT, POINT_CONSTRAINT, SCALE_CONSTRAINT)
+    CONSTRAINTS_SET = frozenset(CONSTRAINTS)
     CLUSTER = 'cluster'
     SKINCLUSTER = 'skinCluster'
     TWEAK = 'tweak'
-    GEOMETRY_FILTERS = [CLUSTER, SKINCLUSTER, TWEAK]
+    GEOMETRY_FILTERS = (CLUSTER, SKINCLUSTER, TWEAK)
+    GEOMETRY_FILTERS_SET = frozenset(GEOMETRY_FILTERS)
     NURBS_CURVE = 'nurbsCurve'
     NURBS_SURFACE = 'nurbsSurface'
     MESH = 'mesh'
-    SHAPES = [NURBS_CURVE, NURBS_SURFACE, MESH]
+    SHAPES = (NURBS_CURVE, NURBS_SURFACE, MESH)
+    SHAPES_SET = frozenset(SHAPES)
     TRANSFORM = 'transform'
     JOINT = 'joint'
-    TRANSFORMS = [TRANSFORM, JOINT]
+    TRANSFORMS = (TRANSFORM, JOINT)
+    TRANSFORMS_SET = frozenset(TRANSFORMS)
     REFERENCE = 'reference'
 
 
@@ -148,14 +163,16 @@ class RotateOrder(object):
     XZY = 'xzy'
     YXZ = 'yxz'
     ZYX = 'zyx'
-    ALL = [XYZ, YZX, ZXY, XZY, YXZ, ZYX]
+    ALL = (XYZ, YZX, ZXY, XZY, YXZ, ZYX)
+    ALL_SET = frozenset(ALL)
 
 
 class SurfaceAssociation(object):
     CLOSEST_COMPONENT = 'closestComponent'
     CLOSEST_POINT = 'closestPoint'
     RAYCAST = 'rayCast'
-    ALL = [CLOSEST_COMPONENT, CLOSEST_POINT, RAYCAST]
+    ALL = (CLOSEST_COMPONENT, CLOSEST_POINT, RAYCAST)
+    ALL_SET = frozenset(ALL)
 
 
 class TangentType(object):
@@ -169,7 +186,8 @@ class TangentType(object):
     SPLINE = 'spline'
     STEP = 'step'
     STEPNEXT = 'stepnext'
-    ALL = [AUTO, CLAMPED, FAST, FLAT, LINEAR, PLATEAU, SLOW, SPLINE, STEP, STEPNEXT]
+    ALL = (AUTO, CLAMPED, FAST, FLAT, LINEAR, PLATEAU, SLOW, SPLINE, STEP, STEPNEXT)
+    ALL_SET = frozenset(ALL)
 
 
 class Transform(object):
@@ -189,12 +207,13 @@ class Transform(object):
     SHEAR_XY = 'shearXY'
     SHEAR_XZ = 'shearXZ'
     SHEAR_YZ = 'shearYZ'
-    TRANSLATES = [TRANSLATE_X, TRANSLATE_Y, TRANSLATE_Z]
-    ROTATES = [ROTATE_X, ROTATE_Y, ROTATE_Z]
-    SCALES = [SCALE_X, SCALE_Y, SCALE_Z]
-    SHEARS = [SHEAR_XY, SHEAR_XZ, SHEAR_YZ]
-    GENERAL = [TRANSLATE, ROTATE, SCALE, SHEAR]
+    TRANSLATES = (TRANSLATE_X, TRANSLATE_Y, TRANSLATE_Z)
+    ROTATES = (ROTATE_X, ROTATE_Y, ROTATE_Z)
+    SCALES = (SCALE_X, SCALE_Y, SCALE_Z)
+    SHEARS = (SHEAR_XY, SHEAR_XZ, SHEAR_YZ)
+    GENERAL = (TRANSLATE, ROTATE, SCALE, SHEAR)
     ALL = GENERAL + TRANSLATES + ROTATES + SCALES + SHEARS
+    ALL_SET = frozenset(ALL)
 
 
 class WorldUpType(object):
@@ -203,4 +222,5 @@ class WorldUpType(object):
     OBJECT_ROTATION = 'objectrotation'
     VECTOR = 'vector'
     NONE = 'none'
-    ALL = [SCENE, OBJECT, OBJECT_ROTATION, VECTOR, NONE]
+    ALL = (SCENE, OBJECT, OBJECT_ROTATION, VECTOR, NONE)
+    ALL_SET = frozenset(ALL)
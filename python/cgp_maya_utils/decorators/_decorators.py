@@ -4,7 +4,8 @@ maya decorators - also usable as contexts
 
 # imports third-parties
 import maya.cmds
-import maya.mel
+import maya.api.OpenMaya
+import maya.api.OpenMayaAnim
 import cgp_generic_utils.decorators
 
 
@@ -36,7 +37,7 @@ class DisableAutoKey(cgp_generic_utils.decorators.Decorator):
 
 
 class DisableViewport(cgp_generic_utils.decorators.Decorator):
-    """decorator that disable viewport drawing and reactivate it
+    """decorator that pause viewport drawing and set it back to its original state
     """
 
     def __init__(self):
@@ -44,23 +45,28 @@ class DisableViewport(cgp_generic_utils.decorators.Decorator):
         """
 
         # init
-        self._viewport = str(maya.mel.eval('global string $gMainPane; $temp = $gMainPane;'))
+        self._pauseStates = []
 
     def __enter__(self):
         """enter DisableViewport decorator
         """
 
+        # get pause status - ogs pause is a toggle so it is only flipped if the viewport is not already paused
+        # states are stacked as the same instance is entered again when the decorated function recurses
+        wasPaused = maya.cmds.ogs(query=True, pause=True)
+        self._pauseStates.append(wasPaused)
+
         # execute
-        maya.cmds.refresh(suspend=True)
-        maya.cmds.paneLayout(self._viewport, edit=True, manage=False)
+        if not wasPaused:
+            maya.cmds.ogs(pause=True)
 
     def __exit__(self, *args, **kwargs):
         """exit DisableViewport decorator
         """
 
         # execute
-        maya.cmds.refresh(suspend=False)
-        maya.cmds.paneLayout(self._viewport, edit=True, manage=True)
+        if not self._pauseStates.pop():
+            maya.cmds.ogs(pause=True)
 
 
 class KeepCurrentFrame(cgp_generic_utils.decorators.Decorator):
@@ -107,21 +113,24 @@ class KeepCurrentFrameRange(cgp_generic_utils.decorators.Decorator):
         """enter KeepCurrentFrameRange decorator
         """
 
+        # get ui time unit
+        uiUnit = maya.api.OpenMaya.MTime.uiUnit()
+
         # store frameRange values
-        self._minimumTime = maya.cmds.playbackOptions(query=True, minTime=True)
-        self._maximumTime = maya.cmds.playbackOptions(query=True, maxTime=True)
-        self._animationStart = maya.cmds.playbackOptions(query=True, animationStartTime=True)
-        self._animationEnd = maya.cmds.playbackOptions(query=True, animationEndTime=True)
+        self._minimumTime = maya.api.OpenMayaAnim.MAnimControl.minTime().asUnits(uiUnit)
+        self._maximumTime = maya.api.OpenMayaAnim.MAnimControl.maxTime().asUnits(uiUnit)
+        self._animationStart = maya.api.OpenMayaAnim.MAnimControl.animationStartTime().asUnits(uiUnit)
+        self._animationEnd = maya.api.OpenMayaAnim.MAnimControl.animationEndTime().asUnits(uiUnit)
 
     def __exit__(self, *args, **kwargs):
         """exit KeepCurrentFrameRange decorator
         """
 
         # execute
-        maya.cmds.playbackOptions(minTime=self._minimumTime)
-        maya.cmds.playbackOptions(maxTime=self._maximumTime)
-        maya.cmds.playbackOptions(animationStartTime=self._animationStart)
-        maya.cmds.playbackOptions(animationEndTime=self._animationEnd)
+        maya.cmds.playbackOptions(minTime=self._minimumTime,
+                                  maxTime=self._maximumTime,
+                                  animationStartTime=self._animationStart,
+                                  animationEndTime=self._animationEnd)
 
 
 class KeepCurrentSelection(cgp_generic_utils.decorators.Decorator):
@@ -164,21 +173,21 @@ class NamespaceContext(cgp_generic_utils.decorators.Decorator):
 
         # init
         self._contextNamespace = str(contextNamespace)
-        self._originalNamespace = maya.cmds.namespaceInfo(currentNamespace=True, absoluteName=True)
+        self._originalNamespace = maya.api.OpenMaya.MNamespace.currentNamespace()
 
     def __enter__(self):
         """enter NamespaceContext decorator
         """
 
         # execute
-        maya.cmds.namespace(setNamespace=self._contextNamespace)
+        maya.api.OpenMaya.MNamespace.setCurrentNamespace(self._contextNamespace)
 
     def __exit__(self, *args, **kwargs):
         """exit NamespaceContext decorator
         """
 
         # execute
-        maya.cmds.namespace(setNamespace=self._originalNamespace)
+        maya.api.OpenMaya.MNamespace.setCurrentNamespace(self._originalNamespace)
 
 
 class UndoChunk(cgp_generic_utils.decorators.Decorator):
@@ -198,18 +207,29 @@ class UndoChunk(cgp_generic_utils.decorators.Decorator):
         # init
         self._name = name
         self._isUndoing = isUndoing
+        self._openStates = []
 
     def __enter__(self):
         """enter UndoChunk decorator
         """
 
+        # get undo state - chunks are skipped when the undo queue is disabled as they would record nothing
+        # states are stacked as the same instance is entered again when the decorated function recurses
+        isChunkOpen = maya.cmds.undoInfo(query=True, state=True)
+        self._openStates.append(isChunkOpen)
+
         # execute
-        maya.cmds.undoInfo(openChunk=True, chunkName=self._name)
+        if isChunkOpen:
+            maya.cmds.undoInfo(openChunk=True, chunkName=self._name)
 
     def __exit__(self, exceptionType, *args, **kwargs):
         """exit UndoChunk decorator
         """
 
+        # return if no chunk was opened
+        if not self._openStates.pop():
+            return
+
         # close chunk
         maya.cmds.undoInfo(closeChunk=True)
 
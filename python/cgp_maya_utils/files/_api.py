@@ -6,6 +6,10 @@ maya files management functions
 import cgp_generic_utils.files
 
 
+# maya file types - filled on the first registration
+_FILE_TYPES = {}
+
+
 # COMMANDS #
 
 
@@ -13,9 +17,14 @@ def registerFileTypes():
     """register maya file types to grant generic file management functions access to the maya file objects
     """
 
+    # return if already registered
+    if _FILE_TYPES:
+        return
+
     # imports file modules
     from ._maya import MayaFile, MaFile, MbFile, ObjFile
 
+    # get file types
     fileTypes = {'mayaFile': MayaFile,
                  'ma': MaFile,
                  'mb': MbFile,
@@ -23,3 +32,4 @@ def registerFileTypes():
 
     # execute
     cgp_generic_utils.files.registerFileTypes(fileTypes)
+    _FILE_TYPES.update(fileTypes)
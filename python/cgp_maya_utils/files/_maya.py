@@ -11,6 +11,11 @@ import cgp_generic_utils.constants
 import cgp_maya_utils.decorators
 
 
+# default file arguments used when importing without namespace
+_IMPORT_ARGS_DEFAULT = {'options': 'v=0;'}
+_REFERENCE_ARGS_DEFAULT = {'namespace': ':', 'options': 'v=0;'}
+
+
 # MAYA FILE OBJECTS #
 
 
@@ -54,16 +59,16 @@ class MayaFile(cgp_generic_utils.files.File):
         """
 
         # init
-        namespace = str(namespace)
+        namespace = str(namespace) if namespace else None
 
         # reference
         if asReference:
-            fileArgs = {'namespace': namespace} if namespace else {'namespace': ':', 'options': 'v=0;'}
+            fileArgs = {'namespace': namespace} if namespace else _REFERENCE_ARGS_DEFAULT
             maya.cmds.file(self.path(), reference=asReference, prompt=False, **fileArgs)
 
         # classic import
         else:
-            fileArgs = {'namespace': namespace} if namespace else {'options': 'v=0;'}
+            fileArgs = {'namespace': namespace} if namespace else _IMPORT_ARGS_DEFAULT
             maya.cmds.file(self.path(), i=True, type=self._dataType, **fileArgs)
 
     def open(self, force=False):
@@ -8,7 +8,7 @@ from ._api import (attribute, connection, createAttribute, getAttributes, getNod
                    currentNamespace, namespace, plugin, scene,
                    component,
                    createNode, getNodes, node,
-                   _registerAttributeTypes, _registerComponentTypes, _registerMiscTypes, _registerNodeTypes)
+                   _registerTypes)
 
 from ._misc._misc import Namespace, Plugin, Scene
 
@@ -97,10 +97,10 @@ __componentTypes = {'component': Component,
                     'v[]': IsoparmV,
                     'sf[][]': SurfacePatch}
 
-_registerAttributeTypes(__attributeTypes)
-_registerMiscTypes(__miscTypes)
-_registerNodeTypes(__nodeTypes)
-_registerComponentTypes(__componentTypes)
+_registerTypes(attributeTypes=__attributeTypes,
+               componentTypes=__componentTypes,
+               miscTypes=__miscTypes,
+               nodeTypes=__nodeTypes)
 
 
 __all__ = ['attribute', 'connection', 'createAttribute', 'getAttributes', 'getNodesFromAttributes',
@@ -108,7 +108,6 @@ __all__ = ['attribute', 'connection', 'createAttribute', 'getAttributes', 'getNo
            'currentNamespace', 'namespace', 'plugin', 'scene',
            'Namespace', 'Plugin', 'Scene',
            'Attribute', 'Connection',
-           'Double3Attribute', 'Float3Attribute',
            'BoolAttribute', 'EnumAttribute', 'MatrixAttribute', 'MessageAttribute', 'StringAttribute',
            'ByteAttribute', 'DoubleAngleAttribute', 'DoubleAttribute', 'DoubleLinearAttribute',
            'NumericAttribute', 'FloatAttribute', 'LongAttribute', 'ShortAttribute', 'TimeAttribute',
@@ -121,7 +120,7 @@ __all__ = ['attribute', 'connection', 'createAttribute', 'getAttributes', 'getNo
            'AnimCurve', 'AnimCurveTA', 'AnimCurveTL', 'AnimCurveTU',
            'Constraint', 'AimConstraint', 'OrientConstraint', 'ParentConstraint',
            'PointConstraint', 'ScaleConstraint',
-           'Node', 'DagNode', 'Reference',
+           'Node', 'DagNode', 'ObjectSet', 'Reference',
            'GeometryFilter', 'BlendShape', 'SkinCluster',
            'IkEffector', 'IkHandle',
            'Shape', 'NurbsCurve', 'NurbsSurface', 'Mesh',
@@ -17,6 +17,9 @@ _COMPONENT_TYPES = {}
 _MISC_TYPES = {}
 _NODE_TYPES = {}
 
+_COMPONENT_REGEX = re.compile(r'(.+)\.([a-zA-Z]+)\[[0-9]+](\[[0-9]+])?$')
+_SHAPE_TYPES = cgp_maya_utils.constants.NodeType.SHAPES_SET
+
 
 # ATTRIBUTE COMMANDS #
 
@@ -53,7 +56,7 @@ def attribute(fullName):
     attributeType = maya.cmds.getAttr(fullName, type=True)
 
     # return
-    return _ATTRIBUTE_TYPES.get(attributeType, _ATTRIBUTE_TYPES['attribute'])(fullName)
+    return (_ATTRIBUTE_TYPES.get(attributeType) or _ATTRIBUTE_TYPES['attribute'])(fullName)
 
 
 def connection(source, destination):
@@ -149,22 +152,13 @@ def getAttributes(name, attributeTypes=None):
                   :class:`cgp_maya_utils.scene.TimeAttribute`]
     """
 
-    # init
-    attributes = []
-
     # list all
     if not attributeTypes:
         attributes = maya.cmds.ls('*.{0}'.format(name), recursive=True)
 
-    # list by types
+    # list by types - ls type flag is multi-use so every type is listed in a single call
     else:
-        for attributeType in attributeTypes:
-
-            # get listed attributes
-            listedAttributes = maya.cmds.ls('*.{0}'.format(name), recursive=True, type=attributeType)
-
-            # extend attributes
-            attributes.extend(listedAttributes)
+        attributes = maya.cmds.ls('*.{0}'.format(name), recursive=True, type=list(attributeTypes))
 
     # return
     return tuple([attribute(attribute_) for attribute_ in attributes])
@@ -205,24 +199,18 @@ def getNodesFromAttributes(attributes):
 
     # init
     data = []
-    toQuery = []
+    toQuery = set()
     attributes = set(attributes)
 
     # init
-    for attr in sorted(attributes):
-        toQuery.extend(maya.cmds.ls('*.{0}'.format(attr), recursive=True, objectsOnly=True) or [])
+    for attr in attributes:
+        toQuery.update(maya.cmds.ls('*.{0}'.format(attr), recursive=True, objectsOnly=True) or [])
 
     # execute
-    for node_ in set(toQuery):
-
-        # get all the existing tags on the node
-        attrs = maya.cmds.listAttr(node_)
+    for node_ in toQuery:
 
-        # get specified attributes on the node
-        specifiedAttributes = sorted(attributes.intersection(set(attrs)))
-
-        # update data
-        if attributes == specifiedAttributes:
+        # update data if all the specified attributes exist on the node
+        if attributes.issubset(maya.cmds.listAttr(node_) or []):
             data.append(node(node_))
 
     # return
@@ -252,23 +240,25 @@ def component(fullName):
             :class:`cgp_maya_utils.scene.Vertex`,
     """
 
+    # init
+    match = _COMPONENT_REGEX.match(fullName)
+
     # errors
-    if (not re.match(r'.+\.[a-zA-Z]+\[[0-9]+]$', fullName) and
-            not re.match(r'.+\.[a-zA-Z]+\[[0-9]+]\[[0-9]+]$', fullName)):
+    if not match:
         raise ValueError('{0} is not a valid component'.format(fullName))
 
     # init
-    shape, comp = fullName.split('.')
+    shape, componentName, secondIndex = match.groups()
 
     # errors
-    if maya.cmds.nodeType(shape) not in cgp_maya_utils.constants.NodeType.SHAPES:
+    if maya.cmds.nodeType(shape) not in _SHAPE_TYPES:
         raise ValueError('{0} is not a shape node'.format(shape))
 
     # get infos
-    componentType = ''.join([char for char in comp if not char.isdigit()])
+    componentType = '{0}[][]'.format(componentName) if secondIndex else '{0}[]'.format(componentName)
 
     # return
-    return _COMPONENT_TYPES.get(componentType, _COMPONENT_TYPES['component'])(fullName)
+    return (_COMPONENT_TYPES.get(componentType) or _COMPONENT_TYPES['component'])(fullName)
 
 
 # MISC COMMANDS #
@@ -370,7 +360,7 @@ def createNode(data, **extraData):
     data.update(extraData)
 
     # init attribute object
-    nodeObject = _NODE_TYPES.get(data['nodeType'], _NODE_TYPES['node'])
+    nodeObject = _NODE_TYPES.get(data['nodeType']) or _NODE_TYPES['node']
 
     # return
     return nodeObject.create(**data)
@@ -415,29 +405,22 @@ def getNodes(namePattern=None, nodeTypes=None, asExactNodeTypes=False):
                   :class:`cgp_maya_utils.scene.Transform`]
     """
 
-    # init
-    nodes = []
-
     # list all
     if not nodeTypes:
         nodes = (maya.cmds.ls(namePattern, recursive=True)
                  if namePattern
                  else maya.cmds.ls(recursive=True))
 
-    # list by types
+    # list by types - ls type flags are multi-use so every type is listed in a single call
     else:
-        for nodeType in nodeTypes:
-
-            # get typeArg
-            typeArg = {'exactType': nodeType} if asExactNodeTypes else {'type': nodeType}
 
-            # get listedNodes
-            listedNodes = (maya.cmds.ls(namePattern, recursive=True, **typeArg)
-                           if namePattern
-                           else maya.cmds.ls(recursive=True, **typeArg))
+        # get typeArg
+        typeArg = {'exactType': list(nodeTypes)} if asExactNodeTypes else {'type': list(nodeTypes)}
 
-            # extend nodes
-            nodes.extend(listedNodes)
+        # get nodes
+        nodes = (maya.cmds.ls(namePattern, recursive=True, **typeArg)
+                 if namePattern
+                 else maya.cmds.ls(recursive=True, **typeArg))
 
     # return
     return tuple([node(node_) for node_ in nodes])
@@ -476,17 +459,14 @@ def node(name):
             :class:`cgp_maya_utils.scene.Transform`
     """
 
-    # get the current object
-    currentObject = _NODE_TYPES['node']
-
-    # init node object
-    for nodeType in reversed(maya.cmds.nodeType(name, inherited=True)):
-        if nodeType in _NODE_TYPES:
-            currentObject = _NODE_TYPES[nodeType]
-            break
+    # init node object - the inherited types end with the exact type so the most specific registered type wins
+    for nodeType in reversed(maya.cmds.nodeType(name, inherited=True) or []):
+        nodeObject = _NODE_TYPES.get(nodeType)
+        if nodeObject is not None:
+            return nodeObject(name)
 
     # return
-    return currentObject(name)
+    return _NODE_TYPES['node'](name)
 
 
 # PRIVATE COMMANDS #
@@ -534,3 +514,28 @@ def _registerNodeTypes(nodeTypes):
 
     # execute
     _NODE_TYPES.update(nodeTypes)
+
+
+def _registerTypes(attributeTypes=None, componentTypes=None, miscTypes=None, nodeTypes=None):
+    """register attribute / component / misc / node types in a single call
+
+    :param attributeTypes: attribute types to register
+    :type attributeTypes: dict
+
+    :param componentTypes: component types to register
+    :type componentTypes: dict
+
+    :param miscTypes: misc types to register
+    :type miscTypes: dict
+
+    :param nodeTypes: node types to register
+    :type nodeTypes: dict
+    """
+
+    # execute
+    for registry, types in ((_ATTRIBUTE_TYPES, attributeTypes),
+                            (_COMPONENT_TYPES, componentTypes),
+                            (_MISC_TYPES, miscTypes),
+                            (_NODE_TYPES, nodeTypes)):
+        if types:
+            registry.update(types)
@@ -108,7 +108,7 @@ class Connection(object):
 
         # init
         toQueries = ['{0}.{1}'.format(node, attr) for attr in attributes] if attributes else [str(node)]
-        nodeTypes = nodeTypes or []
+        nodeTypes = frozenset(nodeTypes or ())
         data = []
 
         # get source connections
@@ -127,21 +127,21 @@ class Connection(object):
                                                            skipConversionNodes=skipConversionNodes,
                                                            connections=True) or [] if destinations else []
 
-        # sort connections
-        sourceConnections = reversed(zip(*[iter(reversed(sourceConnections))] * 2))
-        destinationConnections = reversed(zip(*[iter(destinationConnections)] * 2))
+        # sort connections - listConnections returns flat [queried, connected, ...] lists
+        sourceConnections = zip(sourceConnections[1::2], sourceConnections[::2])
+        destinationConnections = zip(destinationConnections[::2], destinationConnections[1::2])[::-1]
 
         # execute
         for index, connections in enumerate([sourceConnections, destinationConnections]):
             for connection in connections:
 
-                # check if not is a connectedType
-                isValid = bool(set(maya.cmds.nodeType(connection[index], inherited=True)) & set(nodeTypes))
+                # check if the connected node is of a specified type - only queried if node types are specified
+                isValid = (not nodeTypes.isdisjoint(maya.cmds.nodeType(connection[index], inherited=True))
+                           if nodeTypes
+                           else True)
 
                 # update
-                if (not nodeTypes and nodeTypesIncluded
-                        or nodeTypes and nodeTypesIncluded and isValid
-                        or nodeTypes and not nodeTypesIncluded and not isValid):
+                if isValid == bool(nodeTypesIncluded):
                     data.append(cls(*connection))
 
         # return
@@ -566,7 +566,7 @@ class Attribute(object):
         """
 
         # return
-        return cgp_maya_utils.scene._api.node(self.fullName().split('.')[0])
+        return cgp_maya_utils.scene._api.node(self.fullName().partition('.')[0])
 
     def setLock(self, isLocked):
         """set the lock state of the attribute
@@ -589,7 +589,7 @@ class Attribute(object):
         newName = maya.cmds.renameAttr(self.fullName(), name)
 
         # update fullname
-        self._fullName = '{0}.{1}'.format(self._fullName.split('.')[0], newName)
+        self._fullName = '{0}.{1}'.format(self._fullName.partition('.')[0], newName)
 
     def setValue(self, value):
         """set the value on the attribute
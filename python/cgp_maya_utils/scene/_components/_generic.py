@@ -131,7 +131,7 @@ class Component(object):
         """
 
         # return
-        return cgp_maya_utils.scene._api.node(self._fullName.split('.')[0])
+        return cgp_maya_utils.scene._api.node(self._fullName.partition('.')[0])
 
 
 class TransformComponent(Component):
@@ -269,6 +269,11 @@ class Scene(object):
     """scene object that manipulates a live scene
     """
 
+    # ATTRIBUTES #
+
+    _mainWindow = None
+    _viewport = None
+
     # INIT #
 
     def __repr__(self):
@@ -330,21 +335,28 @@ class Scene(object):
         # return
         return cgp_generic_utils.files.entity(path) if path else None
 
-    @staticmethod
-    def mainWindow():
-        """get the maya main window
+    @classmethod
+    def mainWindow(cls):
+        """get the maya main window - the main window lives for the whole session so it is only searched once
 
         :return: the main window
         :rtype: :class:`PySide2.QtWidgets.QMainWindow`
         """
 
-        # get maya application
-        mayaApplication = PySide2.QtWidgets.QApplication.instance()
+        # get main window
+        if cls._mainWindow is None:
+
+            # get maya application
+            mayaApplication = PySide2.QtWidgets.QApplication.instance()
+
+            # get main window
+            for widget in mayaApplication.topLevelWidgets():
+                if widget.objectName() == 'MayaWindow':
+                    cls._mainWindow = widget
+                    break
 
         # return
-        for widget in mayaApplication.topLevelWidgets():
-            if widget.objectName() == 'MayaWindow':
-                return widget
+        return cls._mainWindow
 
     @staticmethod
     def maximumTime():
@@ -434,16 +446,20 @@ class Scene(object):
         # execute
         maya.cmds.playbackOptions(minTime=value)
 
-    @staticmethod
-    def viewport():
-        """the viewport of the scene
+    @classmethod
+    def viewport(cls):
+        """the viewport of the scene - the main pane never changes during a session so it is only queried once
 
         :return: the viewport of the scene
         :rtype: str
         """
 
+        # get main pane - not cached while empty as the main pane does not exist before the ui is built
+        if not cls._viewport:
+            cls._viewport = str(maya.mel.eval('global string $gMainPane; $temp = $gMainPane;'))
+
         # return
-        return str(maya.mel.eval('global string $gMainPane; $temp = $gMainPane;'))
+        return cls._viewport
 
     # COMMANDS #
 
@@ -234,7 +234,7 @@ class Constraint(_generic.DagNode):
 
         # errors
         for attr in drivenAttributes:
-            if attr not in cgp_maya_utils.constants.Transform.ALL:
+            if attr not in cgp_maya_utils.constants.Transform.ALL_SET:
                 raise ValueError('{0} is not a valid driven attribute - {1}'
                                  .format(attr, cgp_maya_utils.constants.Transform.ALL))
 
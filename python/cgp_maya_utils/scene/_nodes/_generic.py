@@ -164,7 +164,7 @@ class Node(object):
         # errors
         if attributeTypes:
             for attributeType in attributeTypes:
-                if attributeType not in cgp_maya_utils.constants.AttributeType.ALL:
+                if attributeType not in cgp_maya_utils.constants.AttributeType.ALL_SET:
                     raise ValueError('{0} is not a valid type - {1}'
                                      .format(attributeType, cgp_maya_utils.constants.AttributeType.ALL))
 
@@ -176,7 +176,7 @@ class Node(object):
             queryAttributeTypes = attributeTypes
 
         elif attributeTypes and not attributeTypesIncluded:
-            queryAttributeTypes = set(cgp_maya_utils.constants.AttributeType.ALL) - set(attributeTypes)
+            queryAttributeTypes = cgp_maya_utils.constants.AttributeType.ALL_SET.difference(attributeTypes)
 
         # execute
         for attribute in maya.cmds.listAttr(self.name()):
@@ -64,7 +64,7 @@ class IkHandle(_transform.Transform):
         solverType = solverType or cgp_maya_utils.constants.Solver.IK_RP_SOLVER
 
         # errors
-        if solverType not in cgp_maya_utils.constants.Solver.IK_SOLVERS:
+        if solverType not in cgp_maya_utils.constants.Solver.IK_SOLVERS_SET:
             raise ValueError('{0} is not a valid ik solver type - {1}'
                              .format(solverType, cgp_maya_utils.constants.Solver.IK_SOLVERS))
 
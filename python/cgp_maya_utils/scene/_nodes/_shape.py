@@ -516,10 +516,10 @@ class NurbsCurve(Shape):
         degree = degree or cgp_maya_utils.constants.GeometryData.CUBIC
 
         # errors
-        if form not in cgp_maya_utils.constants.GeometryData.FORMS:
+        if form not in cgp_maya_utils.constants.GeometryData.FORMS_SET:
             raise ValueError('{0} is not a valid shape form type'.format(form))
 
-        if degree not in cgp_maya_utils.constants.GeometryData.DEGREES:
+        if degree not in cgp_maya_utils.constants.GeometryData.DEGREES_SET:
             raise ValueError('{0} is not a valid geometry degree'.format(degree))
 
         # create closed curve
@@ -681,11 +681,11 @@ class NurbsSurface(Shape):
 
         # errors
         for form in [formU, formV]:
-            if form not in cgp_maya_utils.constants.GeometryData.FORMS:
+            if form not in cgp_maya_utils.constants.GeometryData.FORMS_SET:
                 raise ValueError('{0} is not a valid shape form type'.format(form))
 
         for degree in [degreeU, degreeV]:
-            if degree not in cgp_maya_utils.constants.GeometryData.DEGREES:
+            if degree not in cgp_maya_utils.constants.GeometryData.DEGREES_SET:
                 raise ValueError('{0} is not a valid geometry degree'.format(form))
 
         if not knotsU:
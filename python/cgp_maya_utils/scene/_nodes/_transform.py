@@ -66,7 +66,7 @@ class Transform(_generic.DagNode):
         """
 
         # errors
-        if rotateOrder and rotateOrder not in cgp_maya_utils.constants.RotateOrder.ALL:
+        if rotateOrder and rotateOrder not in cgp_maya_utils.constants.RotateOrder.ALL_SET:
             raise ValueError('{0} is not a valid rotate order - {1}'
                              .format(rotateOrder, cgp_maya_utils.constants.RotateOrder.ALL))
 
@@ -141,7 +141,7 @@ class Transform(_generic.DagNode):
         # errors
         if constraintTypes:
             for cstrType in constraintTypes:
-                if cstrType not in cgp_maya_utils.constants.NodeType.CONSTRAINTS:
+                if cstrType not in cgp_maya_utils.constants.NodeType.CONSTRAINTS_SET:
                     raise ValueError('{0} is not a valid type - {1}'
                                      .format(cstrType, cgp_maya_utils.constants.NodeType.CONSTRAINTS))
 
@@ -328,7 +328,7 @@ class Transform(_generic.DagNode):
         mode = mode or cgp_generic_utils.constants.MirrorMode.MIRROR
 
         # errors
-        if rotateOrder and rotateOrder not in cgp_maya_utils.constants.RotateOrder.ALL:
+        if rotateOrder and rotateOrder not in cgp_maya_utils.constants.RotateOrder.ALL_SET:
             raise ValueError('{0} is not a valid rotateOrder - {1}'
                              .format(rotateOrder, cgp_maya_utils.constants.RotateOrder.ALL))
 
@@ -560,7 +560,7 @@ class Transform(_generic.DagNode):
         # errors
         if shapeTypes:
             for shapeType in shapeTypes:
-                if shapeType not in cgp_maya_utils.constants.NodeType.SHAPES:
+                if shapeType not in cgp_maya_utils.constants.NodeType.SHAPES_SET:
                     raise ValueError('{0} is not a valid type - {1}'
                                      .format(shapeType, cgp_maya_utils.constants.NodeType.SHAPES))
 
@@ -602,7 +602,7 @@ class Transform(_generic.DagNode):
         rotateOrder = rotateOrder or self.attribute('rotateOrder').value()
 
         # errors
-        if rotateOrder and rotateOrder not in cgp_maya_utils.constants.RotateOrder.ALL:
+        if rotateOrder and rotateOrder not in cgp_maya_utils.constants.RotateOrder.ALL_SET:
             raise ValueError('{0} is not a valid rotateOrder - {1}'
                              .format(rotateOrder, cgp_maya_utils.constants.RotateOrder.ALL))
 
@@ -703,7 +703,7 @@ class Transform(_generic.DagNode):
 
         # errors
         for attr in attributes:
-            if attr not in cgp_maya_utils.constants.Transform.ALL:
+            if attr not in cgp_maya_utils.constants.Transform.ALL_SET:
                 raise ValueError('{0} is not a valid attribute - {1}'
                                  .format(attr, cgp_maya_utils.constants.Transform.ALL))
 